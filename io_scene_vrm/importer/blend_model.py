@@ -25,7 +25,7 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 import bpy
 import mathutils
 import numpy
-from mathutils import Matrix, Vector
+from mathutils import Matrix
 
 from .. import vrm_types
 from ..gl_constants import GlConstants
@@ -125,6 +125,12 @@ class BlendModel:
     def axis_glb_to_blender(vec3: Sequence[float]) -> List[float]:
         return [vec3[i] * t for i, t in zip([0, 2, 1], [-1, 1, 1])]
 
+    @staticmethod
+    def axis_glb_to_blender_array(vec3_array: numpy.ndarray) -> numpy.ndarray:
+        result: numpy.ndarray = vec3_array[:, [0, 2, 1]].astype(numpy.float64)
+        result[:, 0] *= -1
+        return result
+
     def parse_vrm_extension(self) -> None:
         json_dict = self.vrm_pydata.json
         vrm1_draft = json_get(json_dict, ["extensions", "VRMC_vrm-1.0_draft"])
@@ -1428,10 +1434,15 @@ class BlendModel:
         mesh_progress_unit = 1 / max(1, len(self.vrm_pydata.meshes))
         for pymesh in self.vrm_pydata.meshes:
             b_mesh = bpy.data.meshes.new(pymesh[0].name)
-            face_index = [tri for prim in pymesh for tri in prim.face_indices]
+            face_index = [
+                tri
+                for prim in pymesh
+                if prim.face_indices is not None
+                for tri in prim.face_indices
+            ]
             if pymesh[0].POSITION is None:
                 continue
-            pos = list(map(self.axis_glb_to_blender, pymesh[0].POSITION))
+            pos = self.axis_glb_to_blender_array(pymesh[0].POSITION).tolist()
             b_mesh.from_pydata(pos, [], face_index)
             b_mesh.update()
             obj = bpy.data.objects.new(pymesh[0].name, b_mesh)
@@ -1488,6 +1499,8 @@ class BlendModel:
                 # VertexGroupに頂点属性から一個ずつウェイトを入れる用の辞書作り
                 for prim in pymesh:
                     if prim.JOINTS_0 is not None and prim.WEIGHTS_0 is not None:
+                        joints_list = prim.JOINTS_0.tolist()
+                        weights_list = prim.WEIGHTS_0.tolist()
                         # 使うkey(bone名)のvalueを空のリストで初期化(中身まで全部内包表記で?キモすぎるからしない。
                         vg_dict: Dict[str, List[Tuple[int, float]]] = {
                             self.vrm_pydata.nodes_dict[
@@ -1495,12 +1508,12 @@ class BlendModel:
                             ].name: list()
                             for joint_id in [
                                 joint_id
-                                for joint_ids in prim.JOINTS_0
+                                for joint_ids in joints_list
                                 for joint_id in joint_ids
                             ]
                         }
                         for v_index, (joint_ids, weights) in enumerate(
-                            zip(prim.JOINTS_0, prim.WEIGHTS_0)
+                            zip(joints_list, weights_list)
                         ):
                             # region VroidがJoints:[18,18,0,0]とかで格納してるからその処理を
                             normalized_joint_ids = list(dict.fromkeys(joint_ids))
@@ -1573,7 +1586,10 @@ class BlendModel:
 
             # region uv
             flatten_vrm_mesh_vert_index = [
-                ind for prim in pymesh for ind in prim.face_indices.flatten()
+                ind
+                for prim in pymesh
+                if prim.face_indices is not None
+                for ind in prim.face_indices.flatten().tolist()
             ]
 
             for prim in pymesh:
@@ -1585,7 +1601,7 @@ class BlendModel:
                         if channel_name not in b_mesh.uv_layers:
                             b_mesh.uv_layers.new(name=channel_name)
                         blender_uv_data = b_mesh.uv_layers[channel_name].data
-                        vrm_texcoord = getattr(prim, channel_name)
+                        vrm_texcoord = getattr(prim, channel_name).tolist()
                         for node_id, v_index in enumerate(flatten_vrm_mesh_vert_index):
                             blender_uv_data[node_id].uv = vrm_texcoord[v_index]
                             # to blender axis (上下反転)
@@ -1614,16 +1630,19 @@ class BlendModel:
                     prim.vert_normal_normalized is None
                     or not prim.vert_normal_normalized
                 ):
-                    normalized_normal = [
-                        Vector(n)
-                        if abs(Vector(n).magnitude - 1.0) < sys.float_info.epsilon
-                        else Vector(n).normalized()
-                        for n in prim.NORMAL
-                    ]
+                    normal = prim.NORMAL.astype(numpy.float64)
+                    length = numpy.linalg.norm(normal, axis=1, keepdims=True)
+                    normalized_normal = numpy.divide(
+                        normal,
+                        length,
+                        out=normal.copy(),
+                        where=(numpy.abs(length - 1.0) >= sys.float_info.epsilon)
+                        & (length > 0),
+                    ).astype(numpy.float32)
                     prim.vert_normal_normalized = True
                     prim.NORMAL = normalized_normal
                 b_mesh.normals_split_custom_set_from_vertices(
-                    list(map(self.axis_glb_to_blender, normalized_normal))
+                    self.axis_glb_to_blender_array(normalized_normal).tolist()
                 )
             b_mesh.use_auto_smooth = True
             # endregion Normal
@@ -1632,7 +1651,8 @@ class BlendModel:
             face_length = 0
             for prim in pymesh:
                 if (
-                    prim.material_index is None
+                    prim.face_indices is None
+                    or prim.material_index is None
                     or prim.material_index not in self.vrm_materials
                 ):
                     continue
@@ -1672,8 +1692,9 @@ class BlendModel:
                             vc = b_mesh.vertex_colors[vc_color_name]
                         else:
                             vc = b_mesh.vertex_colors.new(name=vc_color_name)
+                        vrm_color = getattr(prim, vc_color_name).tolist()
                         for v_index, _ in enumerate(vc.data):
-                            vc.data[v_index].color = getattr(prim, vc_color_name)[
+                            vc.data[v_index].color = vrm_color[
                                 flatten_vrm_mesh_vert_index[v_index]
                             ]
                         vcolor_count += 1
@@ -1685,11 +1706,10 @@ class BlendModel:
             # region shape_key
             # shapekey_data_factory with cache
             def absolutize_morph_positions(
-                base_points: List[List[float]],
+                base_points: numpy.ndarray,
                 morph_target_pos_and_index: List[Any],
                 prim: vrm_types.Mesh,
             ) -> List[List[float]]:
-                shape_key_positions = []
                 morph_target_pos = morph_target_pos_and_index[0]
                 morph_target_index = morph_target_pos_and_index[1]
 
@@ -1705,13 +1725,10 @@ class BlendModel:
                         (prim.POSITION_accessor, morph_target_index)
                     ]
 
-                for base_pos, morph_pos in zip(base_points, morph_target_pos):
-                    # numpy.array毎回作るのは見た目きれいだけど8倍くらい遅い
-                    shape_key_positions.append(
-                        self.axis_glb_to_blender(
-                            [base_pos[i] + morph_pos[i] for i in range(3)]
-                        )
-                    )
+                count = min(len(base_points), len(morph_target_pos))
+                shape_key_positions: List[List[float]] = self.axis_glb_to_blender_array(
+                    base_points[:count].astype(numpy.float64) + morph_target_pos[:count]
+                ).tolist()
                 morph_cache_dict[
                     (prim.POSITION_accessor, morph_target_index)
                 ] = shape_key_positions
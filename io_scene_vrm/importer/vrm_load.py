@@ -151,7 +151,7 @@ def read_vrm(
             extract_textures_into_folder,
             make_new_texture_folder,
         )
-        vrm_pydata.decoded_binary = decode_bin(vrm_pydata.json, body_binary)
+        vrm_pydata.decoded_binary = decode_bin_as_ndarray(vrm_pydata.json, body_binary)
         mesh_read(vrm_pydata)
         material_read(vrm_pydata)
         skin_read(vrm_pydata)
@@ -409,11 +409,22 @@ def texture_rip(
         vrm_pydata.image_properties.append(image_property)
 
 
-#  "accessorの順に" データを読み込んでリストにしたものを返す
-def decode_bin(json_data: Dict[str, Any], binary: bytes) -> List[Any]:
-    br = BinaryReader(binary)
+GL_COMPONENT_TYPE_TO_NUMPY_DTYPE = {
+    GlConstants.UNSIGNED_INT: "<u4",
+    GlConstants.INT: "<i4",
+    GlConstants.UNSIGNED_SHORT: "<u2",
+    GlConstants.SHORT: "<i2",
+    GlConstants.FLOAT: "<f4",
+    GlConstants.UNSIGNED_BYTE: "<u1",
+}
+
+
+#  "accessorの順に" データを読み込んでndarrayにしたものを返す
+def decode_bin_as_ndarray(
+    json_data: Dict[str, Any], binary: bytes
+) -> List[numpy.ndarray]:
     # This list indexed by accessor index
-    decoded_binary: List[Any] = []
+    decoded_binary: List[numpy.ndarray] = []
     buffer_views = json_data["bufferViews"]
     accessors = json_data["accessors"]
     type_num_dict = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT4": 16}
@@ -423,24 +434,41 @@ def decode_bin(json_data: Dict[str, Any], binary: bytes) -> List[Any]:
             print(
                 f"WARNING: accessors[{accessor_index}] doesn't have bufferView that is not implemented yet"
             )
-            decoded_binary.append([])
+            decoded_binary.append(numpy.empty((0, type_num) if type_num > 1 else 0))
             continue
-        br.set_pos(buffer_views[accessor["bufferView"]]["byteOffset"])
-        data_list = []
-        for _ in range(accessor["count"]):
-            if type_num == 1:
-                data = br.read_as_data_type(accessor["componentType"])
-            else:
-                data = []  # type: ignore[assignment]
-                for _ in range(type_num):
-                    data.append(br.read_as_data_type(accessor["componentType"]))  # type: ignore[union-attr]
-            data_list.append(data)
-        decoded_binary.append(data_list)
+        dtype_name = GL_COMPONENT_TYPE_TO_NUMPY_DTYPE.get(accessor["componentType"])
+        if dtype_name is None:
+            print("unsupported type : {}".format(accessor["componentType"]))
+            raise Exception
+        dtype = numpy.dtype(dtype_name)
+        # astype() copies into a writable array in native byte order
+        data = numpy.frombuffer(
+            binary,
+            dtype=dtype,
+            count=accessor["count"] * type_num,
+            offset=buffer_views[accessor["bufferView"]]["byteOffset"],
+        ).astype(dtype.newbyteorder("="))
+        if type_num > 1:
+            data = data.reshape(-1, type_num)
+        decoded_binary.append(data)
 
     return decoded_binary
 
 
+#  "accessorの順に" データを読み込んでリストにしたものを返す
+def decode_bin(json_data: Dict[str, Any], binary: bytes) -> List[Any]:
+    return [data.tolist() for data in decode_bin_as_ndarray(json_data, binary)]
+
+
 def mesh_read(vrm_pydata: vrm_types.VrmPydata) -> None:
+    # 古いUniVRMのuv誤りはファイル単位なので一度だけ判定する
+    legacy_uv_flag = False  # f***
+    gen = str(json_get(vrm_pydata.json, ["assets", "generator"], ""))
+    if re.match("UniGLTF", gen):
+        with contextlib.suppress(ValueError):
+            if float("".join(gen[-4:])) < 1.16:
+                legacy_uv_flag = True
+
     # メッシュをパースする
     for n, mesh in enumerate(vrm_pydata.json.get("meshes", [])):
         primitives = []
@@ -460,7 +488,9 @@ def mesh_read(vrm_pydata: vrm_types.VrmPydata) -> None:
             face_indices = vrm_pydata.decoded_binary[primitive["indices"]]
             # 3要素ずつに変換しておく(GlConstants.TRIANGLES前提なので)
             # ATTENTION これだけndarray
-            vrm_mesh.face_indices = numpy.reshape(face_indices, (-1, 3))
+            vrm_mesh.face_indices = numpy.asarray(
+                face_indices, dtype=numpy.uint32
+            ).reshape(-1, 3)
             # endregion 頂点index
 
             # ここから頂点属性
@@ -472,21 +502,13 @@ def mesh_read(vrm_pydata: vrm_types.VrmPydata) -> None:
                 )
 
             # region TEXCOORD_FIX [ 古いUniVRM誤り: uv.y = -uv.y ->修復 uv.y = 1 - ( -uv.y ) => uv.y=1+uv.y]
-            legacy_uv_flag = False  # f***
-            gen = str(json_get(vrm_pydata.json, ["assets", "generator"], ""))
-            if re.match("UniGLTF", gen):
-                with contextlib.suppress(ValueError):
-                    if float("".join(gen[-4:])) < 1.16:
-                        legacy_uv_flag = True
-
             uv_count = 0
             while True:
                 texcoord_name = "TEXCOORD_{}".format(uv_count)
                 if hasattr(vrm_mesh, texcoord_name):
                     texcoord = getattr(vrm_mesh, texcoord_name)
                     if legacy_uv_flag:
-                        for uv in texcoord:
-                            uv[1] = 1 + uv[1]
+                        texcoord[:, 1] += 1
                     uv_count += 1
                 else:
                     break
@@ -21,6 +21,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import bmesh
 import bpy
+import numpy
 from mathutils import Matrix
 
 from .. import vrm_types
@@ -1446,9 +1447,8 @@ class GlbObj:
             position_min_max = [[fmax, fmax, fmax], [fmin, fmin, fmin]]
             normal_bin = b""
             joints_bin = b""
-            weights_bin = b""
+            weights_list: List[List[float]] = []
             texcoord_bins = {uvlayer_id: b"" for uvlayer_id in uvlayers_dic.keys()}
-            float_vec4_packer = struct.Struct("<ffff").pack
             float_vec3_packer = struct.Struct("<fff").pack
             float_pair_packer = struct.Struct("<ff").pack
             unsigned_int_scalar_packer = struct.Struct("<I").pack
@@ -1572,13 +1572,8 @@ class GlbObj:
                             weights = [1.0, 0, 0, 0]
                             joints = [hips_bone_index, 0, 0, 0]
 
-                        normalized_weights = (
-                            vrm_types.normalize_weights_compatible_with_gl_float(
-                                weights
-                            )
-                        )
                         joints_bin += unsigned_short_vec4_packer(*joints)
-                        weights_bin += float_vec4_packer(*normalized_weights)
+                        weights_list.append(weights)
 
                     vert_location = self.axis_blender_to_glb(loop.vert.co)
                     position_bin += float_vec3_packer(*vert_location)
@@ -1597,6 +1592,14 @@ class GlbObj:
                     primitive_index_vertex_count[primitive_index] += 1
                     unique_vertex_id += 1  # noqa: SIM113
 
+            weights_bin = (
+                vrm_types.normalize_weights_batch(
+                    numpy.array(weights_list, dtype=numpy.float64).reshape(-1, 4)
+                )
+                .astype("<f4")
+                .tobytes()
+            )
+
             # DONE :index position, uv, normal, position morph,JOINT WEIGHT
             # TODO: morph_normal, v_color...?
             primitive_glbs_dic = OrderedDict(
@@ -1848,7 +1851,7 @@ class GlbObj:
                     )
             vrm0_humanoid_dic.update(
                 self.textblock2json_dict(
-                    "humanoid_params", vrm_types.Vrm0.HUMANOID_DEFAULT_PARAMS
+                    "humanoid_params", dict(vrm_types.Vrm0.HUMANOID_DEFAULT_PARAMS)
                 )
             )
         else:
@@ -1876,7 +1879,7 @@ class GlbObj:
         # endregion humanoid
         # region firstPerson
         vrm_fp_dic = self.textblock2json_dict(
-            "firstPerson_params", vrm_types.Vrm0.FIRST_PERSON_DEFAULT_PARAMS
+            "firstPerson_params", vrm_types.Vrm0.default_first_person_params()
         )
         vrm_extension_dic["firstPerson"] = vrm_fp_dic
         if "firstPersonBone" in vrm_fp_dic and vrm_fp_dic["firstPersonBone"] != -1:
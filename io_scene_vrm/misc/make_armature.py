@@ -1,13 +1,104 @@
 import json
 from math import radians
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 import bpy
-from mathutils import Matrix
+from mathutils import Matrix, Vector
 
 from ..vrm_types import Vrm0
 from .template_mesh_maker import IcypTemplateMeshMaker
 
+# ボーンのrollは決まった角度しか使わない
+_ROLL_RADIANS = {roll: radians(roll) for roll in (0, 90, -90, 180)}
+
+# 指の長さの合計(手の大きさに対する比率)
+_THUMB_MIDDLE_FINGER_LEN_FACTOR = 1 / 2
+_INDEX_RING_FINGER_LEN_FACTOR = 1 / 2 - (1 / 2.3125) * (1 / 2) / 3
+_LITTLE_FINGER_LEN_FACTOR = _INDEX_RING_FINGER_LEN_FACTOR * (
+    (1 / 2.3125) + (1 / 2.3125) * 0.75
+)
+
+# finger_name:(Proximal, Intermediate, Distal, Nail)のbase_name
+_FINGER_BONE_BASE_NAMES = {
+    finger_name: (
+        finger_name + "Proximal",
+        finger_name + "Intermediate",
+        finger_name + "Distal",
+        finger_name + "Nail",
+    )
+    for finger_name in ("Thumb", "Index", "Middle", "Ring", "Little")
+}
+
+# base_name:(左右のボーン名)
+_MIRROR_BONE_NAMES = {
+    base_name: ("Left" + base_name + "Bone", "Right" + base_name + "Bone")
+    for base_name in (
+        "Eye",
+        "UpperLeg",
+        "LowerLeg",
+        "Foot",
+        "Toes",
+        "Shoulder",
+        "UpperArm",
+        "LowerArm",
+        "Hand",
+        *(
+            finger_base_name
+            for finger_base_names in _FINGER_BONE_BASE_NAMES.values()
+            for finger_base_name in finger_base_names
+        ),
+    )
+}
+
+# base_name:(左右のVRMのボーン名)。Nailに対応するVRMのボーンは無い
+_MIRROR_VRM_BONE_NAMES = {
+    base_name: ("left" + base_name, "right" + base_name)
+    for base_name in _MIRROR_BONE_NAMES
+    if not base_name.endswith("Nail")
+}
+
+# 未設定のmetaの初期値
+_DEFAULT_METAS: Mapping[str, str] = MappingProxyType(
+    {**dict.fromkeys(Vrm0.METAS, "undefined"), **Vrm0.REQUIRED_METAS}
+)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class BoneSpec:
+    __slots__ = ("index", "name", "head", "tail", "parent", "radius", "roll")
+
+    def __init__(
+        self,
+        index: int,
+        name: str,
+        head: Tuple[float, float, float],
+        tail: Tuple[float, float, float],
+        parent: Optional["BoneSpec"],
+        radius: float,
+        roll: float,
+    ) -> None:
+        self.index = index
+        self.name = name
+        self.head = head
+        self.tail = tail
+        self.parent = parent
+        self.radius = radius
+        self.roll = roll  # radians
+
+    def transform(self, matrix: Matrix) -> None:
+        head = matrix @ Vector(self.head)
+        tail = matrix @ Vector(self.tail)
+        self.head = (head[0], head[1], head[2])
+        self.tail = (tail[0], tail[1], tail[2])
+
 
 class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N801
     bl_idname = "icyp.make_basic_armature"
@@ -132,27 +223,27 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
         bpy.ops.object.add(type="ARMATURE", enter_editmode=True, location=(0, 0, 0))
         armature = context.object
 
-        bone_dic = {}
+        # 位置計算を先に全部済ませて、edit_boneは最後にまとめて作る
+        bone_specs: List[BoneSpec] = []
 
         def bone_add(
             name: str,
             head_pos: Tuple[float, float, float],
             tail_pos: Tuple[float, float, float],
-            parent_bone: Optional[bpy.types.Bone] = None,
+            parent_bone: Optional[BoneSpec] = None,
             radius: float = 0.1,
-            roll: float = 0,
-        ) -> bpy.types.Bone:
-            bone_name = name + "Bone"
-            added_bone = armature.data.edit_bones.new(bone_name)
-            added_bone.head = head_pos
-            added_bone.tail = tail_pos
-            added_bone.head_radius = radius
-            added_bone.tail_radius = radius
-            added_bone.envelope_distance = 0.01
-            added_bone.roll = radians(roll)
-            if parent_bone is not None:
-                added_bone.parent = parent_bone
-            bone_dic.update({bone_name: added_bone})
+            roll: int = 0,
+        ) -> BoneSpec:
+            added_bone = BoneSpec(
+                len(bone_specs),
+                name,
+                head_pos,
+                tail_pos,
+                parent_bone,
+                radius,
+                _ROLL_RADIANS[roll],
+            )
+            bone_specs.append(added_bone)
             return added_bone
 
         # bone_type = "leg" or "arm" for roll setting
@@ -160,10 +251,10 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
             base_name: str,
             right_head_pos: Tuple[float, float, float],
             right_tail_pos: Tuple[float, float, float],
-            parent_bones: Tuple[bpy.types.Bone, bpy.types.Bone],
+            parent_bones: Tuple[BoneSpec, BoneSpec],
             radius: float = 0.1,
             bone_type: str = "other",
-        ) -> Tuple[bpy.types.Bone, bpy.types.Bone]:
+        ) -> Tuple[BoneSpec, BoneSpec]:
             right_roll = 0
             left_roll = 0
             if bone_type == "arm":
@@ -171,8 +262,9 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
             elif bone_type == "leg":
                 right_roll = 90
                 left_roll = 90
+            left_name, right_name = _MIRROR_BONE_NAMES[base_name]
             left_bone = bone_add(
-                "Left" + base_name,
+                left_name,
                 right_head_pos,
                 right_tail_pos,
                 parent_bones[0],
@@ -180,12 +272,10 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
                 roll=left_roll,
             )
 
-            head_pos = [pos * axis for pos, axis in zip(right_head_pos, (-1, 1, 1))]
-            tail_pos = [pos * axis for pos, axis in zip(right_tail_pos, (-1, 1, 1))]
             right_bone = bone_add(
-                "Right" + base_name,
-                (head_pos[0], head_pos[1], head_pos[2]),
-                (tail_pos[0], tail_pos[1], tail_pos[2]),
+                right_name,
+                (-right_head_pos[0], right_head_pos[1], right_head_pos[2]),
+                (-right_tail_pos[0], right_tail_pos[1], right_tail_pos[2]),
                 parent_bones[1],
                 radius=radius,
                 roll=right_roll,
@@ -196,22 +286,20 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
         def x_add(
             pos_a: Tuple[float, float, float], add_x: float
         ) -> Tuple[float, float, float]:
-            pos = [p_a + _add for p_a, _add in zip(pos_a, [add_x, 0, 0])]
-            return (pos[0], pos[1], pos[2])
+            return (pos_a[0] + add_x, pos_a[1], pos_a[2])
 
         def y_add(
             pos_a: Tuple[float, float, float], add_y: float
         ) -> Tuple[float, float, float]:
-            pos = [p_a + _add for p_a, _add in zip(pos_a, [0, add_y, 0])]
-            return (pos[0], pos[1], pos[2])
+            return (pos_a[0], pos_a[1] + add_y, pos_a[2])
 
         def z_add(
             pos_a: Tuple[float, float, float], add_z: float
         ) -> Tuple[float, float, float]:
-            pos = [p_a + _add for p_a, _add in zip(pos_a, [0, 0, add_z])]
-            return (pos[0], pos[1], pos[2])
+            return (pos_a[0], pos_a[1], pos_a[2] + add_z)
 
         head_size = self.head_size()
+        hand_size = self.hand_size()
         # down side (前は8頭身の時の股上/股下の股下側割合、後ろは4頭身のときの〃を年齢具合で線形補完)(股上高めにすると破綻する)
         eight_upside_ratio, four_upside_ratio = (
             1 - self.leg_length_ratio,
@@ -235,19 +323,21 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
         chest_len = backbone_len * 12 / 17  # noqa: F841 mesh生成で使ってる
         spine_len = backbone_len * 5 / 17
 
-        root = bone_add("Root", (0, 0, 0), (0, 0, 0.3))
+        root = bone_add("RootBone", (0, 0, 0), (0, 0, 0.3))
         # 仙骨基部
-        hips = bone_add("Hips", (0, 0, body_separate), (0, 0, hips_tall), root, roll=90)
+        hips = bone_add(
+            "HipsBone", (0, 0, body_separate), (0, 0, hips_tall), root, roll=90
+        )
         # 骨盤基部->胸郭基部
         spine = bone_add(
-            "Spine", hips.tail, z_add(hips.tail, spine_len), hips, roll=-90
+            "SpineBone", hips.tail, z_add(hips.tail, spine_len), hips, roll=-90
         )
         # 胸郭基部->首元
         chest = bone_add(
-            "Chest", spine.tail, z_add(hips.tail, backbone_len), spine, roll=-90
+            "ChestBone", spine.tail, z_add(hips.tail, backbone_len), spine, roll=-90
         )
         neck = bone_add(
-            "Neck",
+            "NeckBone",
             (0, 0, self.tall - head_size - neck_len / 2),
             (0, 0, self.tall - head_size + neck_len / 2),
             chest,
@@ -255,7 +345,7 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
         )
         # 首の1/2は顎の後ろに隠れてる
         head = bone_add(
-            "Head",
+            "HeadBone",
             (0, 0, self.tall - head_size + neck_len / 2),
             (0, 0, self.tall),
             neck,
@@ -324,7 +414,7 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
             x_add(shoulder_parent.tail, shoulder_in_pos),
             x_add(shoulder_parent.tail, shoulder_in_pos + self.shoulder_width),
             (shoulder_parent, shoulder_parent),
-            radius=self.hand_size() * 0.4,
+            radius=hand_size * 0.4,
             bone_type="arm",
         )
 
@@ -338,169 +428,180 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
             shoulders[0].tail,
             x_add(shoulders[0].tail, arm_length),
             shoulders,
-            radius=self.hand_size() * 0.4,
+            radius=hand_size * 0.4,
             bone_type="arm",
         )
 
         # グーにするとパーの半分くらいになる、グーのとき手を含む下腕の長さと上腕の長さが概ね一緒、けど手がでかすぎると破綻する
-        forearm_length = max(arm_length - self.hand_size() / 2, arm_length * 0.8)
+        forearm_length = max(arm_length - hand_size / 2, arm_length * 0.8)
         forearms = x_mirror_bones_add(
             "LowerArm",
             arms[0].tail,
             x_add(arms[0].tail, forearm_length),
             arms,
-            radius=self.hand_size() * 0.4,
+            radius=hand_size * 0.4,
             bone_type="arm",
         )
         hands = x_mirror_bones_add(
             "Hand",
             forearms[0].tail,
-            x_add(forearms[0].tail, self.hand_size() / 2),
+            x_add(forearms[0].tail, hand_size / 2),
             forearms,
-            radius=self.hand_size() / 4,
+            radius=hand_size / 4,
             bone_type="arm",
         )
 
+        # 指の節の長さの比率は全部の指で共通
+        finger_1_2_ratio = self.finger_1_2_ratio
+        finger_2_3_ratio = self.finger_2_3_ratio
+        finger_normalize = 1 / (
+            finger_1_2_ratio * finger_2_3_ratio + finger_1_2_ratio + 1
+        )
+
         def fingers(
             finger_name: str,
             proximal_pos: Tuple[float, float, float],
             finger_len_sum: float,
         ) -> Tuple[
-            Tuple[bpy.types.Bone, bpy.types.Bone],
-            Tuple[bpy.types.Bone, bpy.types.Bone],
-            Tuple[bpy.types.Bone, bpy.types.Bone],
+            Tuple[BoneSpec, BoneSpec],
+            Tuple[BoneSpec, BoneSpec],
+            Tuple[BoneSpec, BoneSpec],
         ]:
-
-            finger_normalize = 1 / (
-                self.finger_1_2_ratio * self.finger_2_3_ratio
-                + self.finger_1_2_ratio
-                + 1
-            )
+            (
+                proximal_name,
+                intermediate_name,
+                distal_name,
+                nail_name,
+            ) = _FINGER_BONE_BASE_NAMES[finger_name]
             proximal_finger_len = finger_len_sum * finger_normalize
-            intermediate_finger_len = (
-                finger_len_sum * finger_normalize * self.finger_1_2_ratio
-            )
-            distal_finger_len = (
-                finger_len_sum
-                * finger_normalize
-                * self.finger_1_2_ratio
-                * self.finger_2_3_ratio
-            )
+            intermediate_finger_len = proximal_finger_len * finger_1_2_ratio
+            distal_finger_len = intermediate_finger_len * finger_2_3_ratio
             proximal_bones = x_mirror_bones_add(
-                f"{finger_name}Proximal",
+                proximal_name,
                 proximal_pos,
                 x_add(proximal_pos, proximal_finger_len),
                 hands,
-                self.hand_size() / 18,
+                hand_size / 18,
                 bone_type="arm",
             )
             intermediate_bones = x_mirror_bones_add(
-                f"{finger_name}Intermediate",
+                intermediate_name,
                 proximal_bones[0].tail,
                 x_add(proximal_bones[0].tail, intermediate_finger_len),
                 proximal_bones,
-                self.hand_size() / 18,
+                hand_size / 18,
                 bone_type="arm",
             )
             distal_bones = x_mirror_bones_add(
-                f"{finger_name}Distal",
+                distal_name,
                 intermediate_bones[0].tail,
                 x_add(intermediate_bones[0].tail, distal_finger_len),
                 intermediate_bones,
-                self.hand_size() / 18,
+                hand_size / 18,
                 bone_type="arm",
             )
             if self.nail_bone:
                 x_mirror_bones_add(
-                    f"{finger_name}Nail",
+                    nail_name,
                     distal_bones[0].tail,
                     x_add(distal_bones[0].tail, distal_finger_len),
                     distal_bones,
-                    self.hand_size() / 20,
+                    hand_size / 20,
                     bone_type="arm",
                 )
             return proximal_bones, intermediate_bones, distal_bones
 
-        finger_y_offset = -self.hand_size() / 16
+        finger_y_offset = -hand_size / 16
         thumbs = fingers(
             "Thumb",
             y_add(hands[0].head, finger_y_offset * 3),
-            self.hand_size() / 2,
+            hand_size * _THUMB_MIDDLE_FINGER_LEN_FACTOR,
         )
 
-        mats = [thumbs[0][i].matrix.translation for i in [0, 1]]
-        mats = [Matrix.Translation(mat) for mat in mats]
+        # 親指の付け根を中心にZ軸回転
+        mats = [Matrix.Translation(thumbs[0][i].head) for i in [0, 1]]
+        thumb_mats = [
+            mats[n] @ Matrix.Rotation(radians(angle), 4, "Z") @ mats[n].inverted()
+            for n, angle in enumerate([-45, 45])
+        ]
         for j in range(3):
-            for n, angle in enumerate([-45, 45]):
-                thumbs[j][n].transform(mats[n].inverted(), scale=False, roll=False)
-                thumbs[j][n].transform(Matrix.Rotation(radians(angle), 4, "Z"))
-                thumbs[j][n].transform(mats[n], scale=False, roll=False)
-                thumbs[j][n].roll = [0, radians(180)][n]
+            for n in range(2):
+                thumbs[j][n].transform(thumb_mats[n])
+                thumbs[j][n].roll = (_ROLL_RADIANS[0], _ROLL_RADIANS[180])[n]
 
         index_fingers = fingers(
             "Index",
             y_add(hands[0].tail, finger_y_offset * 3),
-            (self.hand_size() / 2) - (1 / 2.3125) * (self.hand_size() / 2) / 3,
+            hand_size * _INDEX_RING_FINGER_LEN_FACTOR,
         )
         middle_fingers = fingers(
-            "Middle", y_add(hands[0].tail, finger_y_offset), self.hand_size() / 2
+            "Middle",
+            y_add(hands[0].tail, finger_y_offset),
+            hand_size * _THUMB_MIDDLE_FINGER_LEN_FACTOR,
         )
         ring_fingers = fingers(
             "Ring",
             y_add(hands[0].tail, -finger_y_offset),
-            (self.hand_size() / 2) - (1 / 2.3125) * (self.hand_size() / 2) / 3,
+            hand_size * _INDEX_RING_FINGER_LEN_FACTOR,
         )
         little_fingers = fingers(
             "Little",
             y_add(hands[0].tail, -finger_y_offset * 3),
-            ((self.hand_size() / 2) - (1 / 2.3125) * (self.hand_size() / 2) / 3)
-            * ((1 / 2.3125) + (1 / 2.3125) * 0.75),
+            hand_size * _LITTLE_FINGER_LEN_FACTOR,
         )
 
-        body_dict = {
+        # VRM bone name : blender bone name
+        bone_name_all_dict = {
             "hips": hips.name,
             "spine": spine.name,
             "chest": chest.name,
             "neck": neck.name,
             "head": head.name,
         }
-
-        left_right_body_dict = {
-            f"{left_right}{bone_name}": bones[lr].name
-            for bone_name, bones in {
-                "Eye": eyes,
-                "UpperLeg": upside_legs,
-                "LowerLeg": lower_legs,
-                "Foot": foots,
-                "Toes": toes,
-                "Shoulder": shoulders,
-                "UpperArm": arms,
-                "LowerArm": forearms,
-                "Hand": hands,
-            }.items()
-            for lr, left_right in enumerate(["left", "right"])
-        }
+        for base_name, bones in (
+            ("Eye", eyes),
+            ("UpperLeg", upside_legs),
+            ("LowerLeg", lower_legs),
+            ("Foot", foots),
+            ("Toes", toes),
+            ("Shoulder", shoulders),
+            ("UpperArm", arms),
+            ("LowerArm", forearms),
+            ("Hand", hands),
+        ):
+            left_name, right_name = _MIRROR_VRM_BONE_NAMES[base_name]
+            bone_name_all_dict[left_name] = bones[0].name
+            bone_name_all_dict[right_name] = bones[1].name
 
         # VRM finger like name key
-        fingers_dict = {
-            f"{left_right}{finger_name}{position}": finger[i][lr].name
-            for finger_name, finger in zip(
-                ["Thumb", "Index", "Middle", "Ring", "Little"],
-                [thumbs, index_fingers, middle_fingers, ring_fingers, little_fingers],
-            )
-            for i, position in enumerate(["Proximal", "Intermediate", "Distal"])
-            for lr, left_right in enumerate(["left", "right"])
-        }
-
-        # VRM bone name : blender bone name
-        bone_name_all_dict = {}
-        bone_name_all_dict.update(body_dict)
-        bone_name_all_dict.update(left_right_body_dict)
-        bone_name_all_dict.update(fingers_dict)
+        for finger_name, finger in (
+            ("Thumb", thumbs),
+            ("Index", index_fingers),
+            ("Middle", middle_fingers),
+            ("Ring", ring_fingers),
+            ("Little", little_fingers),
+        ):
+            # fingerにNailは含まれないのでzipで落ちる
+            for base_name, bones in zip(_FINGER_BONE_BASE_NAMES[finger_name], finger):
+                left_name, right_name = _MIRROR_VRM_BONE_NAMES[base_name]
+                bone_name_all_dict[left_name] = bones[0].name
+                bone_name_all_dict[right_name] = bones[1].name
+
+        added_bones: List[bpy.types.EditBone] = []
+        for bone_spec in bone_specs:
+            added_bone = armature.data.edit_bones.new(bone_spec.name)
+            added_bone.head = bone_spec.head
+            added_bone.tail = bone_spec.tail
+            added_bone.head_radius = bone_spec.radius
+            added_bone.tail_radius = bone_spec.radius
+            added_bone.envelope_distance = 0.01
+            added_bone.roll = bone_spec.roll
+            if bone_spec.parent is not None:
+                added_bone.parent = added_bones[bone_spec.parent.index]
+            added_bones.append(added_bone)
 
         connect_parent_tail_and_child_head_if_same_position(armature.data)
 
-        context.scene.view_layers.update()
         bpy.ops.object.mode_set(mode="OBJECT")
         context.scene.view_layers.update()
         return armature, bone_name_all_dict
@@ -515,197 +616,206 @@ class ICYP_OT_MAKE_ARMATURE(bpy.types.Operator):  # type: ignore[misc] # noqa: N
     @classmethod
     def make_extension_setting_and_metas(cls, armature: bpy.types.Object) -> None:
         def write_textblock_and_assign_to_armature(
-            block_name: str, value: Union[Dict[str, Any], List[Dict[str, Any]]]
+            block_name: str, value_json: str
         ) -> None:
             text_block = bpy.data.texts.new(name=f"{armature.name}_{block_name}.json")
-            text_block.write(json.dumps(value, indent=4))
+            text_block.write(value_json)
             if block_name not in armature:
                 armature[f"{block_name}"] = text_block.name
 
         # param_dicts are below of this method
         write_textblock_and_assign_to_armature(
-            "humanoid_params", ICYP_OT_MAKE_ARMATURE.humanoid_params
+            "humanoid_params", ICYP_OT_MAKE_ARMATURE.humanoid_params_json
         )
         write_textblock_and_assign_to_armature(
-            "firstPerson_params", ICYP_OT_MAKE_ARMATURE.first_person_params
+            "firstPerson_params", ICYP_OT_MAKE_ARMATURE.first_person_params_json
         )
         write_textblock_and_assign_to_armature(
-            "blendshape_group", ICYP_OT_MAKE_ARMATURE.blendshape_group
+            "blendshape_group", ICYP_OT_MAKE_ARMATURE.blendshape_group_json
         )
         write_textblock_and_assign_to_armature(
-            "spring_bone", ICYP_OT_MAKE_ARMATURE.spring_bone_prams
+            "spring_bone", ICYP_OT_MAKE_ARMATURE.spring_bone_prams_json
         )
 
-        for v in Vrm0.METAS:
-            if v not in armature:
-                armature[v] = "undefined"
-        for k, v in Vrm0.REQUIRED_METAS.items():
+        for k, v in _DEFAULT_METAS.items():
             if k not in armature:
                 armature[k] = v
 
+    # 各テーブルは固定なのでjson.dumpsした文字列も一緒に持つ
+    # MappingProxyTypeはdictとして書き出す
     humanoid_params = Vrm0.HUMANOID_DEFAULT_PARAMS
-    first_person_params = {
-        "firstPersonBone": "HeadBone",
-        "firstPersonBoneOffset": {"x": 0, "y": 0, "z": 0},
-        "meshAnnotations": [],
-        "lookAtTypeName": "Bone",
-        "lookAtHorizontalInner": {
-            "curve": [0, 0, 0, 1, 1, 1, 1, 0],
-            "xRange": 90,
-            "yRange": 8,
-        },
-        "lookAtHorizontalOuter": {
-            "curve": [0, 0, 0, 1, 1, 1, 1, 0],
-            "xRange": 90,
-            "yRange": 12,
-        },
-        "lookAtVerticalDown": {
-            "curve": [0, 0, 0, 1, 1, 1, 1, 0],
-            "xRange": 90,
-            "yRange": 10,
-        },
-        "lookAtVerticalUp": {
-            "curve": [0, 0, 0, 1, 1, 1, 1, 0],
-            "xRange": 90,
-            "yRange": 10,
-        },
-    }
-
-    blendshape_group = [
-        {
-            "name": "Neutral",
-            "presetName": "neutral",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "A",
-            "presetName": "a",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "I",
-            "presetName": "i",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "U",
-            "presetName": "u",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "E",
-            "presetName": "e",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "O",
-            "presetName": "o",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "Blink",
-            "presetName": "blink",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "Joy",
-            "presetName": "joy",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "Angry",
-            "presetName": "angry",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
+    humanoid_params_json = json.dumps(humanoid_params, indent=4, default=dict)
+    first_person_params: Mapping[str, Any] = _freeze(
         {
-            "name": "Sorrow",
-            "presetName": "sorrow",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "Fun",
-            "presetName": "fun",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "LookUp",
-            "presetName": "lookup",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "LookDown",
-            "presetName": "lookdown",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "LookLeft",
-            "presetName": "lookleft",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "LookRight",
-            "presetName": "lookright",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "Blink_L",
-            "presetName": "blink_l",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-        {
-            "name": "Blink_R",
-            "presetName": "blink_r",
-            "binds": [],
-            "materialValues": [],
-            "isBinary": False,
-        },
-    ]
-
-    spring_bone_prams = [
-        {
-            "comment": "",
-            "stiffiness": 1,
-            "gravityPower": 0,
-            "gravityDir": {"x": 0, "y": -1, "z": 0},
-            "dragForce": 0.4,
-            "center": -1,
-            "hitRadius": 0.02,
-            "bones": [],
-            "colliderGroups": [],
+            "firstPersonBone": "HeadBone",
+            "firstPersonBoneOffset": {"x": 0, "y": 0, "z": 0},
+            "meshAnnotations": [],
+            "lookAtTypeName": "Bone",
+            "lookAtHorizontalInner": {
+                "curve": [0, 0, 0, 1, 1, 1, 1, 0],
+                "xRange": 90,
+                "yRange": 8,
+            },
+            "lookAtHorizontalOuter": {
+                "curve": [0, 0, 0, 1, 1, 1, 1, 0],
+                "xRange": 90,
+                "yRange": 12,
+            },
+            "lookAtVerticalDown": {
+                "curve": [0, 0, 0, 1, 1, 1, 1, 0],
+                "xRange": 90,
+                "yRange": 10,
+            },
+            "lookAtVerticalUp": {
+                "curve": [0, 0, 0, 1, 1, 1, 1, 0],
+                "xRange": 90,
+                "yRange": 10,
+            },
         }
-    ]
+    )
+    first_person_params_json = json.dumps(first_person_params, indent=4, default=dict)
+
+    blendshape_group: Sequence[Mapping[str, Any]] = _freeze(
+        [
+            {
+                "name": "Neutral",
+                "presetName": "neutral",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "A",
+                "presetName": "a",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "I",
+                "presetName": "i",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "U",
+                "presetName": "u",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "E",
+                "presetName": "e",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "O",
+                "presetName": "o",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Blink",
+                "presetName": "blink",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Joy",
+                "presetName": "joy",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Angry",
+                "presetName": "angry",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Sorrow",
+                "presetName": "sorrow",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Fun",
+                "presetName": "fun",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "LookUp",
+                "presetName": "lookup",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "LookDown",
+                "presetName": "lookdown",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "LookLeft",
+                "presetName": "lookleft",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "LookRight",
+                "presetName": "lookright",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Blink_L",
+                "presetName": "blink_l",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+            {
+                "name": "Blink_R",
+                "presetName": "blink_r",
+                "binds": [],
+                "materialValues": [],
+                "isBinary": False,
+            },
+        ]
+    )
+    blendshape_group_json = json.dumps(blendshape_group, indent=4, default=dict)
+
+    spring_bone_prams: Sequence[Mapping[str, Any]] = _freeze(
+        [
+            {
+                "comment": "",
+                "stiffiness": 1,
+                "gravityPower": 0,
+                "gravityDir": {"x": 0, "y": -1, "z": 0},
+                "dragForce": 0.4,
+                "center": -1,
+                "hitRadius": 0.02,
+                "bones": [],
+                "colliderGroups": [],
+            }
+        ]
+    )
+    spring_bone_prams_json = json.dumps(spring_bone_prams, indent=4, default=dict)
 
 
 def connect_parent_tail_and_child_head_if_same_position(
@@ -6,11 +6,12 @@ https://opensource.org/licenses/mit-license.php
 """
 
 import math
-import struct
 from sys import float_info
-from typing import Any, Dict, List, Optional, Sequence, Union, cast
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
 import bpy
+import numpy
 
 
 class Gltf:
@@ -34,50 +35,61 @@ class Vrm0:
         "otherPermissionUrl",
         "otherLicenseUrl",
     ]
-    REQUIRED_METAS = {
-        "allowedUserName": "OnlyAuthor",
-        "violentUssageName": "Disallow",
-        "sexualUssageName": "Disallow",
-        "commercialUssageName": "Disallow",
-        "licenseName": "Redistribution_Prohibited",
-    }
-    HUMANOID_DEFAULT_PARAMS: Dict[str, Union[float, bool]] = {
-        "armStretch": 0.05,
-        "legStretch": 0.05,
-        "upperArmTwist": 0.5,
-        "lowerArmTwist": 0.5,
-        "upperLegTwist": 0.5,
-        "lowerLegTwist": 0.5,
-        "feetSpacing": 0,
-        "hasTranslationDoF": False,
-    }
-    FIRST_PERSON_DEFAULT_LOOK_AT_PARAMS = {
-        "curve": [0, 0, 0, 1, 1, 1, 1, 0],
-        "xRange": 90,
-        "yRange": 10,
-    }
-    FIRST_PERSON_DEFAULT_PARAMS: Dict[str, Any] = {
-        "firstPersonBone": -1,
-        "firstPersonBoneOffset": {"x": 0, "y": 0.06, "z": 0},
-        "lookAtHorizontalInner": FIRST_PERSON_DEFAULT_LOOK_AT_PARAMS,
-        "lookAtHorizontalOuter": FIRST_PERSON_DEFAULT_LOOK_AT_PARAMS,
-        "lookAtTypeName": "Bone",
-        "lookAtVerticalDown": FIRST_PERSON_DEFAULT_LOOK_AT_PARAMS,
-        "lookAtVerticalUp": FIRST_PERSON_DEFAULT_LOOK_AT_PARAMS,
-        "meshAnnotations": [],
-    }
+    REQUIRED_METAS: Mapping[str, str] = MappingProxyType(
+        {
+            "allowedUserName": "OnlyAuthor",
+            "violentUssageName": "Disallow",
+            "sexualUssageName": "Disallow",
+            "commercialUssageName": "Disallow",
+            "licenseName": "Redistribution_Prohibited",
+        }
+    )
+    HUMANOID_DEFAULT_PARAMS: Mapping[str, Union[float, bool]] = MappingProxyType(
+        {
+            "armStretch": 0.05,
+            "legStretch": 0.05,
+            "upperArmTwist": 0.5,
+            "lowerArmTwist": 0.5,
+            "upperLegTwist": 0.5,
+            "lowerLegTwist": 0.5,
+            "feetSpacing": 0,
+            "hasTranslationDoF": False,
+        }
+    )
+
+    @staticmethod
+    def default_first_person_look_at_params() -> Dict[str, Any]:
+        return {
+            "curve": [0, 0, 0, 1, 1, 1, 1, 0],
+            "xRange": 90,
+            "yRange": 10,
+        }
+
+    @classmethod
+    def default_first_person_params(cls) -> Dict[str, Any]:
+        # Build fresh objects on each call. The caller is free to mutate them.
+        return {
+            "firstPersonBone": -1,
+            "firstPersonBoneOffset": {"x": 0, "y": 0.06, "z": 0},
+            "lookAtHorizontalInner": cls.default_first_person_look_at_params(),
+            "lookAtHorizontalOuter": cls.default_first_person_look_at_params(),
+            "lookAtTypeName": "Bone",
+            "lookAtVerticalDown": cls.default_first_person_look_at_params(),
+            "lookAtVerticalUp": cls.default_first_person_look_at_params(),
+            "meshAnnotations": [],
+        }
 
 
 class Vrm1:
     METAS: List[str] = []
-    REQUIRED_METAS: Dict[str, str] = {}
+    REQUIRED_METAS: Mapping[str, str] = MappingProxyType({})
 
 
 class VrmPydata:
     def __init__(self, filepath: str, json: Dict[str, Any]) -> None:
         self.filepath = filepath
         self.json = json
-        self.decoded_binary: List[Any] = []
+        self.decoded_binary: List[numpy.ndarray] = []
         self.image_properties: List[ImageProps] = []
         self.meshes: List[List[Mesh]] = []
         self.materials: List[Material] = []
@@ -88,24 +100,39 @@ class VrmPydata:
 
 
 class Mesh:
+    # Unset attributes fall back to these shared immutable class defaults
+    name = ""
+    face_indices: Optional[numpy.ndarray] = None  # (triangle count, 3)
+    skin_id: Optional[int] = None
+    material_index: Optional[int] = None
+    POSITION_accessor: Optional[int] = None
+    # Vertex attributes are numpy arrays shaped (vertex count, component count)
+    # and typed like their accessor, e.g. float32 for POSITION and NORMAL.
+    POSITION: Optional[numpy.ndarray] = None
+    JOINTS_0: Optional[numpy.ndarray] = None
+    WEIGHTS_0: Optional[numpy.ndarray] = None
+    NORMAL: Optional[numpy.ndarray] = None
+    vert_normal_normalized: Optional[bool] = None
+    morph_target_point_list_and_accessor_index_dict: Optional[Dict[str, List[Any]]] = (
+        None
+    )
+
     def __init__(self, object_id: int) -> None:
-        self.name = ""
-        self.face_indices: Any = []  # ndarray
-        self.skin_id: Optional[int] = None
         self.object_id = object_id
-        self.material_index: Optional[int] = None
-        self.POSITION_accessor: Optional[int] = None
-        self.POSITION: Optional[List[List[float]]] = None
-        self.JOINTS_0: Optional[List[List[int]]] = None
-        self.WEIGHTS_0: Optional[List[List[float]]] = None
-        self.NORMAL: Optional[List[List[float]]] = None
-        self.vert_normal_normalized: Optional[bool] = None
-        self.morph_target_point_list_and_accessor_index_dict: Optional[
-            Dict[str, List[Any]]
-        ] = None
 
 
 class Node:
+    __slots__ = (
+        "name",
+        "position",
+        "rotation",
+        "scale",
+        "children",
+        "blend_bone",
+        "mesh_id",
+        "skin_id",
+    )
+
     def __init__(
         self,
         name: str,
@@ -123,22 +150,39 @@ class Node:
         self.skin_id: Optional[int] = None
 
 
+def _make_children_mapping(
+    hierarchy: Mapping[str, str],
+) -> Mapping[str, Tuple[str, ...]]:
+    children: Dict[str, List[str]] = {}
+    for child, parent in hierarchy.items():
+        children.setdefault(parent, []).append(child)
+    return MappingProxyType({k: tuple(v) for k, v in children.items()})
+
+
+def _make_depth_mapping(
+    children: Mapping[str, Tuple[str, ...]], root: str
+) -> Mapping[str, int]:
+    # Depth-first from the root, so the insertion order is parent-first
+    depth: Dict[str, int] = {}
+    stack = [(root, 0)]
+    while stack:
+        name, name_depth = stack.pop()
+        depth[name] = name_depth
+        for child in reversed(children.get(name, ())):
+            stack.append((child, name_depth + 1))
+    return MappingProxyType(depth)
+
+
 class HumanBones:
-    center_req = ["hips", "spine", "chest", "neck", "head"]
-    left_leg_req = ["leftUpperLeg", "leftLowerLeg", "leftFoot"]
-    left_arm_req = ["leftUpperArm", "leftLowerArm", "leftHand"]
-    right_leg_req = ["rightUpperLeg", "rightLowerLeg", "rightFoot"]
-    right_arm_req = ["rightUpperArm", "rightLowerArm", "rightHand"]
-
-    requires = [
-        *center_req[:],
-        *left_leg_req[:],
-        *right_leg_req[:],
-        *left_arm_req[:],
-        *right_arm_req[:],
-    ]
+    center_req = ("hips", "spine", "chest", "neck", "head")
+    left_leg_req = ("leftUpperLeg", "leftLowerLeg", "leftFoot")
+    left_arm_req = ("leftUpperArm", "leftLowerArm", "leftHand")
+    right_leg_req = ("rightUpperLeg", "rightLowerLeg", "rightFoot")
+    right_arm_req = ("rightUpperArm", "rightLowerArm", "rightHand")
+
+    requires = center_req + left_leg_req + right_leg_req + left_arm_req + right_arm_req
 
-    left_arm_def = [
+    left_arm_def = (
         "leftShoulder",
         "leftThumbProximal",
         "leftThumbIntermediate",
@@ -155,9 +199,9 @@ class HumanBones:
         "leftLittleProximal",
         "leftLittleIntermediate",
         "leftLittleDistal",
-    ]
+    )
 
-    right_arm_def = [
+    right_arm_def = (
         "rightShoulder",
         "rightThumbProximal",
         "rightThumbIntermediate",
@@ -174,84 +218,93 @@ class HumanBones:
         "rightLittleProximal",
         "rightLittleIntermediate",
         "rightLittleDistal",
-    ]
-    center_def = ["upperChest", "jaw"]
-    left_leg_def = ["leftToes"]
-    right_leg_def = ["rightToes"]
-    defines = [
-        "leftEye",
-        "rightEye",
-        *center_def[:],
-        *left_leg_def[:],
-        *right_leg_def[:],
-        *left_arm_def[:],
-        *right_arm_def[:],
-    ]
+    )
+    center_def = ("upperChest", "jaw")
+    left_leg_def = ("leftToes",)
+    right_leg_def = ("rightToes",)
+    defines = (
+        ("leftEye", "rightEye")
+        + center_def
+        + left_leg_def
+        + right_leg_def
+        + left_arm_def
+        + right_arm_def
+    )
     # child:parent
-    hierarchy: Dict[str, str] = {
-        # 体幹
-        "leftEye": "head",
-        "rightEye": "head",
-        "jaw": "head",
-        "head": "neck",
-        "neck": "upperChest",
-        "upperChest": "chest",
-        "chest": "spine",
-        "spine": "hips",  # root
-        # 右上
-        "rightShoulder": "chest",
-        "rightUpperArm": "rightShoulder",
-        "rightLowerArm": "rightUpperArm",
-        "rightHand": "rightLowerArm",
-        "rightThumbProximal": "rightHand",
-        "rightThumbIntermediate": "rightThumbProximal",
-        "rightThumbDistal": "rightThumbIntermediate",
-        "rightIndexProximal": "rightHand",
-        "rightIndexIntermediate": "rightIndexProximal",
-        "rightIndexDistal": "rightIndexIntermediate",
-        "rightMiddleProximal": "rightHand",
-        "rightMiddleIntermediate": "rightMiddleProximal",
-        "rightMiddleDistal": "rightMiddleIntermediate",
-        "rightRingProximal": "rightHand",
-        "rightRingIntermediate": "rightRingProximal",
-        "rightRingDistal": "rightRingIntermediate",
-        "rightLittleProximal": "rightHand",
-        "rightLittleIntermediate": "rightLittleProximal",
-        "rightLittleDistal": "rightLittleIntermediate",
-        # 左上
-        "leftShoulder": "chest",
-        "leftUpperArm": "leftShoulder",
-        "leftLowerArm": "leftUpperArm",
-        "leftHand": "leftLowerArm",
-        "leftThumbProximal": "leftHand",
-        "leftThumbIntermediate": "leftThumbProximal",
-        "leftThumbDistal": "leftThumbIntermediate",
-        "leftIndexProximal": "leftHand",
-        "leftIndexIntermediate": "leftIndexProximal",
-        "leftIndexDistal": "leftIndexIntermediate",
-        "leftMiddleProximal": "leftHand",
-        "leftMiddleIntermediate": "leftMiddleProximal",
-        "leftMiddleDistal": "leftMiddleIntermediate",
-        "leftRingProximal": "leftHand",
-        "leftRingIntermediate": "leftRingProximal",
-        "leftRingDistal": "leftRingIntermediate",
-        "leftLittleProximal": "leftHand",
-        "leftLittleIntermediate": "leftLittleProximal",
-        "leftLittleDistal": "leftLittleIntermediate",
-        # 左足
-        "leftUpperLeg": "hips",
-        "leftLowerLeg": "leftUpperLeg",
-        "leftFoot": "leftLowerLeg",
-        "leftToes": "leftFoot",
-        # 右足
-        "rightUpperLeg": "hips",
-        "rightLowerLeg": "rightUpperLeg",
-        "rightFoot": "rightLowerLeg",
-        "rightToes": "rightFoot",
-    }
+    hierarchy: Mapping[str, str] = MappingProxyType(
+        {
+            # 体幹
+            "leftEye": "head",
+            "rightEye": "head",
+            "jaw": "head",
+            "head": "neck",
+            "neck": "upperChest",
+            "upperChest": "chest",
+            "chest": "spine",
+            "spine": "hips",  # root
+            # 右上
+            "rightShoulder": "chest",
+            "rightUpperArm": "rightShoulder",
+            "rightLowerArm": "rightUpperArm",
+            "rightHand": "rightLowerArm",
+            "rightThumbProximal": "rightHand",
+            "rightThumbIntermediate": "rightThumbProximal",
+            "rightThumbDistal": "rightThumbIntermediate",
+            "rightIndexProximal": "rightHand",
+            "rightIndexIntermediate": "rightIndexProximal",
+            "rightIndexDistal": "rightIndexIntermediate",
+            "rightMiddleProximal": "rightHand",
+            "rightMiddleIntermediate": "rightMiddleProximal",
+            "rightMiddleDistal": "rightMiddleIntermediate",
+            "rightRingProximal": "rightHand",
+            "rightRingIntermediate": "rightRingProximal",
+            "rightRingDistal": "rightRingIntermediate",
+            "rightLittleProximal": "rightHand",
+            "rightLittleIntermediate": "rightLittleProximal",
+            "rightLittleDistal": "rightLittleIntermediate",
+            # 左上
+            "leftShoulder": "chest",
+            "leftUpperArm": "leftShoulder",
+            "leftLowerArm": "leftUpperArm",
+            "leftHand": "leftLowerArm",
+            "leftThumbProximal": "leftHand",
+            "leftThumbIntermediate": "leftThumbProximal",
+            "leftThumbDistal": "leftThumbIntermediate",
+            "leftIndexProximal": "leftHand",
+            "leftIndexIntermediate": "leftIndexProximal",
+            "leftIndexDistal": "leftIndexIntermediate",
+            "leftMiddleProximal": "leftHand",
+            "leftMiddleIntermediate": "leftMiddleProximal",
+            "leftMiddleDistal": "leftMiddleIntermediate",
+            "leftRingProximal": "leftHand",
+            "leftRingIntermediate": "leftRingProximal",
+            "leftRingDistal": "leftRingIntermediate",
+            "leftLittleProximal": "leftHand",
+            "leftLittleIntermediate": "leftLittleProximal",
+            "leftLittleDistal": "leftLittleIntermediate",
+            # 左足
+            "leftUpperLeg": "hips",
+            "leftLowerLeg": "leftUpperLeg",
+            "leftFoot": "leftLowerLeg",
+            "leftToes": "leftFoot",
+            # 右足
+            "rightUpperLeg": "hips",
+            "rightLowerLeg": "rightUpperLeg",
+            "rightFoot": "rightLowerLeg",
+            "rightToes": "rightFoot",
+        }
+    )
+    # parent:children
+    children: Mapping[str, Tuple[str, ...]] = _make_children_mapping(hierarchy)
+    # bone:distance from hips
+    depth: Mapping[str, int] = _make_depth_mapping(children, "hips")
+    traversal_order: Tuple[str, ...] = tuple(depth)  # parent-first
+    reverse_order: Tuple[str, ...] = traversal_order[::-1]  # child-first
 
 
 class ImageProps:
+    __slots__ = ("name", "filepath", "filetype")
+
     def __init__(self, name: str, filepath: str, filetype: str) -> None:
         self.name = name
         self.filepath = filepath
@@ -259,12 +312,36 @@ class ImageProps:
 
 
 class Material:
+    __slots__ = ("name", "shader_name")
+
     def __init__(self) -> None:
         self.name = ""
         self.shader_name = ""
 
 
 class MaterialGltf(Material):
+    __slots__ = (
+        "base_color",
+        "metallic_factor",
+        "roughness_factor",
+        "emissive_factor",
+        "color_texture_index",
+        "color_texcoord_index",
+        "metallic_roughness_texture_index",
+        "metallic_roughness_texture_texcoord",
+        "normal_texture_index",
+        "normal_texture_texcoord_index",
+        "emissive_texture_index",
+        "emissive_texture_texcoord_index",
+        "occlusion_texture_index",
+        "occlusion_texture_texcoord_index",
+        "alphaCutoff",
+        "double_sided",
+        "alpha_mode",
+        "shadeless",
+        "vrm_addon_for_blender_legacy_gltf_material",
+    )
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -293,6 +370,8 @@ class MaterialGltf(Material):
 
 
 class MaterialTransparentZWrite(Material):
+    __slots__ = ("float_props_dic", "vector_props_dic", "texture_index_dic")
+
     float_props = [
         "_MainTex",
         "_Cutoff",
@@ -308,74 +387,88 @@ class MaterialTransparentZWrite(Material):
 
     def __init__(self) -> None:
         super().__init__()
-        self.float_props_dic: Dict[str, Optional[float]] = {
-            prop: None for prop in self.float_props
-        }
-        self.vector_props_dic: Dict[str, Optional[List[float]]] = {
-            prop: None for prop in self.vector_props
-        }
-        self.texture_index_dic: Dict[str, Optional[int]] = {
-            tex: None for tex in self.texture_index_list
-        }
+        self.float_props_dic: Dict[str, Optional[float]] = dict.fromkeys(
+            self.float_props
+        )
+        self.vector_props_dic: Dict[str, Optional[List[float]]] = dict.fromkeys(
+            self.vector_props
+        )
+        self.texture_index_dic: Dict[str, Optional[int]] = dict.fromkeys(
+            self.texture_index_list
+        )
 
 
 class MaterialMtoon(Material):
+    __slots__ = (
+        "float_props_dic",
+        "vector_props_dic",
+        "texture_index_dic",
+        "keyword_dic",
+        "tag_dic",
+    )
+
     # {key = MToonProp, val = ShaderNodeGroup_member_name}
     version = 32
-    float_props_exchange_dic: Dict[str, Optional[str]] = {
-        "_MToonVersion": None,
-        "_Cutoff": "CutoffRate",
-        "_BumpScale": "BumpScale",
-        "_ReceiveShadowRate": "ReceiveShadowRate",
-        "_ShadeShift": "ShadeShift",
-        "_ShadeToony": "ShadeToony",
-        "_RimLightingMix": "RimLightingMix",
-        "_RimFresnelPower": "RimFresnelPower",
-        "_RimLift": "RimLift",
-        "_ShadingGradeRate": "ShadingGradeRate",
-        "_LightColorAttenuation": "LightColorAttenuation",
-        "_IndirectLightIntensity": "IndirectLightIntensity",
-        "_OutlineWidth": "OutlineWidth",
-        "_OutlineScaledMaxDistance": "OutlineScaleMaxDistance",
-        "_OutlineLightingMix": "OutlineLightingMix",
-        "_UvAnimScrollX": "UV_Scroll_X",  # TODO #####
-        "_UvAnimScrollY": "UV_Scroll_Y",  # TODO #####
-        "_UvAnimRotation": "UV_Scroll_Rotation",  # TODO #####
-        "_DebugMode": None,
-        "_BlendMode": None,
-        "_OutlineWidthMode": "OutlineWidthMode",
-        "_OutlineColorMode": "OutlineColorMode",
-        "_CullMode": None,
-        "_OutlineCullMode": None,
-        "_SrcBlend": None,
-        "_DstBlend": None,
-        "_ZWrite": None,
-        "_IsFirstSetup": None,
-    }
-
-    texture_kind_exchange_dic: Dict[str, str] = {
-        "_MainTex": "MainTexture",
-        "_ShadeTexture": "ShadeTexture",
-        "_BumpMap": "NormalmapTexture",
-        "_ReceiveShadowTexture": "ReceiveShadow_Texture",
-        "_ShadingGradeTexture": "ShadingGradeTexture",
-        "_EmissionMap": "Emission_Texture",
-        "_SphereAdd": "SphereAddTexture",
-        "_RimTexture": "RimTexture",
-        "_OutlineWidthTexture": "OutlineWidthTexture",
-        "_UvAnimMaskTexture": "UV_Animation_Mask_Texture",  # TODO ####
-    }
-    vector_base_props_exchange_dic: Dict[str, str] = {
-        "_Color": "DiffuseColor",
-        "_ShadeColor": "ShadeColor",
-        "_EmissionColor": "EmissionColor",
-        "_RimColor": "RimColor",
-        "_OutlineColor": "OutlineColor",
-    }
+    float_props_exchange_dic: Mapping[str, Optional[str]] = MappingProxyType(
+        {
+            "_MToonVersion": None,
+            "_Cutoff": "CutoffRate",
+            "_BumpScale": "BumpScale",
+            "_ReceiveShadowRate": "ReceiveShadowRate",
+            "_ShadeShift": "ShadeShift",
+            "_ShadeToony": "ShadeToony",
+            "_RimLightingMix": "RimLightingMix",
+            "_RimFresnelPower": "RimFresnelPower",
+            "_RimLift": "RimLift",
+            "_ShadingGradeRate": "ShadingGradeRate",
+            "_LightColorAttenuation": "LightColorAttenuation",
+            "_IndirectLightIntensity": "IndirectLightIntensity",
+            "_OutlineWidth": "OutlineWidth",
+            "_OutlineScaledMaxDistance": "OutlineScaleMaxDistance",
+            "_OutlineLightingMix": "OutlineLightingMix",
+            "_UvAnimScrollX": "UV_Scroll_X",  # TODO #####
+            "_UvAnimScrollY": "UV_Scroll_Y",  # TODO #####
+            "_UvAnimRotation": "UV_Scroll_Rotation",  # TODO #####
+            "_DebugMode": None,
+            "_BlendMode": None,
+            "_OutlineWidthMode": "OutlineWidthMode",
+            "_OutlineColorMode": "OutlineColorMode",
+            "_CullMode": None,
+            "_OutlineCullMode": None,
+            "_SrcBlend": None,
+            "_DstBlend": None,
+            "_ZWrite": None,
+            "_IsFirstSetup": None,
+        }
+    )
+
+    texture_kind_exchange_dic: Mapping[str, str] = MappingProxyType(
+        {
+            "_MainTex": "MainTexture",
+            "_ShadeTexture": "ShadeTexture",
+            "_BumpMap": "NormalmapTexture",
+            "_ReceiveShadowTexture": "ReceiveShadow_Texture",
+            "_ShadingGradeTexture": "ShadingGradeTexture",
+            "_EmissionMap": "Emission_Texture",
+            "_SphereAdd": "SphereAddTexture",
+            "_RimTexture": "RimTexture",
+            "_OutlineWidthTexture": "OutlineWidthTexture",
+            "_UvAnimMaskTexture": "UV_Animation_Mask_Texture",  # TODO ####
+        }
+    )
+    vector_base_props_exchange_dic: Mapping[str, str] = MappingProxyType(
+        {
+            "_Color": "DiffuseColor",
+            "_ShadeColor": "ShadeColor",
+            "_EmissionColor": "EmissionColor",
+            "_RimColor": "RimColor",
+            "_OutlineColor": "OutlineColor",
+        }
+    )
     # texture offset and scaling props by texture
-    vector_props_exchange_dic = {}
-    vector_props_exchange_dic.update(vector_base_props_exchange_dic)
-    vector_props_exchange_dic.update(texture_kind_exchange_dic)
+    vector_props_exchange_dic: Mapping[str, str] = MappingProxyType(
+        {**vector_base_props_exchange_dic, **texture_kind_exchange_dic}
+    )
 
     keyword_list = [
         "_NORMALMAP",
@@ -391,37 +484,32 @@ class MaterialMtoon(Material):
     ]
     tagmap_list = ["RenderType"]
 
+    # Per-instance defaults, copied in __init__
+    _float_props_template: Dict[str, Optional[float]] = dict.fromkeys(
+        float_props_exchange_dic
+    )
+    _vector_props_template: Dict[str, Optional[Sequence[float]]] = dict.fromkeys(
+        vector_props_exchange_dic
+    )
+    _texture_index_template: Dict[str, Optional[int]] = dict.fromkeys(
+        texture_kind_exchange_dic
+    )
+    _keyword_template: Dict[str, bool] = dict.fromkeys(keyword_list, False)
+    _tag_template: Dict[str, Optional[str]] = dict.fromkeys(tagmap_list)
+
     def __init__(self) -> None:
         super().__init__()
-        self.float_props_dic: Dict[str, Optional[float]] = {
-            prop: None for prop in self.float_props_exchange_dic
-        }
-        self.vector_props_dic: Dict[str, Optional[Sequence[float]]] = {
-            prop: None for prop in self.vector_props_exchange_dic
-        }
-        self.texture_index_dic: Dict[str, Optional[int]] = {
-            prop: None for prop in self.texture_kind_exchange_dic
-        }
-        self.keyword_dic: Dict[str, bool] = {kw: False for kw in self.keyword_list}
-        self.tag_dic: Dict[str, Optional[str]] = {tag: None for tag in self.tagmap_list}
+        self.float_props_dic = self._float_props_template.copy()
+        self.vector_props_dic = self._vector_props_template.copy()
+        self.texture_index_dic = self._texture_index_template.copy()
+        self.keyword_dic = self._keyword_template.copy()
+        self.tag_dic = self._tag_template.copy()
 
 
 def make_json_return_value(
     v: Any,
 ) -> Union[int, bool, float, str, List[Any], Dict[str, Any], None]:
-    if v is None:
-        return None
-    if isinstance(v, int):
-        return v
-    if isinstance(v, float):
-        return v
-    if isinstance(v, bool):
-        return v
-    if isinstance(v, str):
-        return v
-    if isinstance(v, list):
-        return v
-    if isinstance(v, dict):
+    if v is None or isinstance(v, (int, float, bool, str, list, dict)):
         return v
 
     print(f"WARNING: {v} is unrecognized type")
@@ -430,30 +518,39 @@ def make_json_return_value(
 
 def nested_json_value_getter(
     json: Optional[Union[Dict[str, Any], List[Any]]],
-    attrs: List[Union[int, str]],
+    attrs: Sequence[Union[int, str]],
     default: Optional[Union[int, float, str, List[Any], Dict[str, Any]]] = None,
 ) -> Union[int, bool, float, str, List[Any], Dict[str, Any], None]:
     if json is None:
         return default
 
-    attr = attrs.pop(0)
-
-    if isinstance(json, list) and isinstance(attr, int) and 0 <= attr < len(json):
-        if not attrs:
-            return make_json_return_value(json[attr])
-        return nested_json_value_getter(json[attr], attrs, default)
+    # Walk the path without recursion and without consuming the caller's list
+    current: Any = json
+    i = 0
+    while i < len(attrs):
+        attr = attrs[i]
+        i += 1
+
+        if (
+            isinstance(current, list)
+            and isinstance(attr, int)
+            and 0 <= attr < len(current)
+        ):
+            current = current[attr]
+            continue
+
+        if isinstance(current, dict) and isinstance(attr, str) and attr in current:
+            current = current[attr]
+            continue
 
-    if isinstance(json, dict) and isinstance(attr, str) and attr in json:
-        if not attrs:
-            return make_json_return_value(json[attr])
-        return nested_json_value_getter(json[attr], attrs, default)
+        return default
 
-    return default
+    return make_json_return_value(current)
 
 
 def nested_json_list_getter(
     json: Optional[Union[Dict[str, Any], List[Any]]],
-    attrs: List[Union[int, str]],
+    attrs: Sequence[Union[int, str]],
     default: List[Any],
 ) -> List[Any]:
     result = nested_json_value_getter(json, attrs, default)
@@ -466,21 +563,82 @@ def normalize_weights_compatible_with_gl_float(
     if abs(sum(weights) - 1.0) < float_info.epsilon:
         return weights
 
-    def to_gl_float(array4: Sequence[float]) -> Sequence[float]:
-        return list(struct.unpack("<ffff", struct.pack("<ffff", *array4)))
+    # Simulate export and import. Casting to float32 rounds exactly like
+    # packing the values as GL_FLOAT and reading them back.
+    gl_weights = numpy.array(weights, dtype=numpy.float32)
 
-    # Simulate export and import
-    weights = to_gl_float(weights)
+    # The error of the current weights is carried over from the previous step
+    # instead of being summed again.
+    error = abs(1 - math.fsum(gl_weights.tolist()))
     for _ in range(10):
-        next_weights = to_gl_float([weights[i] / sum(weights) for i in range(4)])
-        error = abs(1 - math.fsum(weights))
-        next_error = abs(1 - math.fsum(next_weights))
-        if error >= float_info.epsilon and error > next_error:
-            weights = next_weights
-        else:
+        if error < float_info.epsilon:
             break
-
-    return weights
+        weights_sum = float(sum(gl_weights.tolist()))
+        # All-zero weights divide into NaN, which never counts as an improvement
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            next_gl_weights = (gl_weights.astype(numpy.float64) / weights_sum).astype(
+                numpy.float32
+            )
+        next_error = abs(1 - math.fsum(next_gl_weights.tolist()))
+        if not error > next_error:
+            break
+        gl_weights = next_gl_weights
+        error = next_error
+
+    return cast(List[float], gl_weights.tolist())
+
+
+def _sum_gl_float_weights_rows(
+    weights: numpy.ndarray, compensated: bool = False
+) -> numpy.ndarray:
+    # Sum each row column by column in the same order as sum(). With
+    # compensated, Neumaier summation stands in for math.fsum.
+    total = numpy.zeros(weights.shape[0], dtype=numpy.float64)
+    compensation = numpy.zeros(weights.shape[0], dtype=numpy.float64)
+    for column in weights.astype(numpy.float64).T:
+        next_total = total + column
+        if compensated:
+            compensation += numpy.where(
+                numpy.abs(total) >= numpy.abs(column),
+                (total - next_total) + column,
+                (column - next_total) + total,
+            )
+        total = next_total
+    return total + compensation
+
+
+# normalize_weights_compatible_with_gl_float for each row of (N, 4) weights.
+# Returns (N, 4) float32 weights.
+def normalize_weights_batch(weights: numpy.ndarray) -> numpy.ndarray:
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    weights_sum = _sum_gl_float_weights_rows(weights)
+
+    gl_weights = weights.astype(numpy.float32)
+    error = numpy.abs(1 - _sum_gl_float_weights_rows(gl_weights, compensated=True))
+    active = (numpy.abs(weights_sum - 1.0) >= float_info.epsilon) & (
+        error >= float_info.epsilon
+    )
+    for _ in range(10):
+        active_indices = numpy.flatnonzero(active)
+        if not active_indices.size:
+            break
+        active_gl_weights = gl_weights[active_indices].astype(numpy.float64)
+        active_sum = _sum_gl_float_weights_rows(active_gl_weights)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            next_gl_weights = (active_gl_weights / active_sum[:, None]).astype(
+                numpy.float32
+            )
+        next_error = numpy.abs(
+            1 - _sum_gl_float_weights_rows(next_gl_weights, compensated=True)
+        )
+        improved = error[active_indices] > next_error
+        improved_indices = active_indices[improved]
+        gl_weights[improved_indices] = next_gl_weights[improved]
+        error[improved_indices] = next_error[improved]
+        active[active_indices[~improved]] = False
+        active[improved_indices] = error[improved_indices] >= float_info.epsilon
+
+    return gl_weights
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import struct
 from typing import List
 from unittest import TestCase
 
@@ -5,6 +6,30 @@ from io_scene_vrm.importer import vrm_load
 
 
 class TestImporter(TestCase):
+    def test_decode_bin_as_ndarray(self) -> None:
+        binary = struct.pack("<3H2x", 0, 1, 65535) + struct.pack(
+            "<6f", 1.0, -2.5, 0.25, 3.0, 0.0, -0.125
+        )
+        json_data = {
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": 6},
+                {"buffer": 0, "byteOffset": 8, "byteLength": 24},
+            ],
+            "accessors": [
+                {"bufferView": 0, "componentType": 5123, "count": 3, "type": "SCALAR"},
+                {"bufferView": 1, "componentType": 5126, "count": 2, "type": "VEC3"},
+                {"componentType": 5126, "count": 2, "type": "VEC3"},
+            ],
+        }
+        scalars, vec3_array, empty = vrm_load.decode_bin_as_ndarray(json_data, binary)
+        self.assertEqual((3,), scalars.shape)
+        self.assertEqual((2, 3), vec3_array.shape)
+        self.assertEqual((0, 3), empty.shape)
+        self.assertEqual(
+            [[0, 1, 65535], [[1.0, -2.5, 0.25], [3.0, 0.0, -0.125]], []],
+            vrm_load.decode_bin(json_data, binary),
+        )
+
     def test_validate_license_url(self) -> None:
         for url, confirmation_required in [
             ("", False),
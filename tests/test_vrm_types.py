@@ -1,13 +1,16 @@
 import sys
-from typing import Sequence, cast
+from typing import List, Sequence, Union, cast
 from unittest import TestCase
 
+import numpy
+
 from io_scene_vrm import vrm_types
 
 
 class TestVrmTypes(TestCase):
     def test_normalize_weights_compatible_with_gl_float(self) -> None:
         for arg, expected in [
+            ([0, 0, 0, 0], [0, 0, 0, 0]),
             ([1, 0, 0, 0], [1, 0, 0, 0]),
             ([2, 0, 0, 0], [1, 0, 0, 0]),
             ([1, 3, 0, 0], [0.25, 0.75, 0, 0]),
@@ -23,6 +26,50 @@ class TestVrmTypes(TestCase):
                     expected, actual, f"Expected: {expected}, Actual: {actual}"
                 )
 
+    def test_normalize_weights_batch(self) -> None:
+        args: List[List[float]] = [
+            [0, 0, 0, 0],
+            [1, 0, 0, 0],
+            [2, 0, 0, 0],
+            [1, 3, 0, 0],
+            [2, 2, 2, 2],
+            [0, 0, 0, sys.float_info.epsilon],
+            [0, sys.float_info.epsilon, 0, sys.float_info.epsilon],
+            [0.1, 0.2, 0.3, 0.4],
+        ]
+        actual = vrm_types.normalize_weights_batch(numpy.array(args))
+        for arg, actual_weights in zip(args, actual.tolist()):
+            with self.subTest(arg):
+                expected = list(
+                    numpy.array(
+                        vrm_types.normalize_weights_compatible_with_gl_float(arg),
+                        dtype=numpy.float32,
+                    ).tolist()
+                )
+                self.assertEqual(
+                    expected,
+                    actual_weights,
+                    f"Expected: {expected}, Actual: {actual_weights}",
+                )
+
+    def test_normalize_weights_batch_matches_fsum(self) -> None:
+        # The batch path replaces math.fsum with a compensated row sum
+        random = numpy.random.RandomState(0)
+        args = numpy.concatenate(
+            [
+                random.random_sample((2000, 4)),
+                random.random_sample((2000, 4)) * [1, 1e-8, 1e-20, 1e-30],
+                random.random_sample((2000, 4)) * [1e10, 1, 1, 1e-10],
+            ]
+        )
+        actual = vrm_types.normalize_weights_batch(args).tolist()
+        for arg, actual_weights in zip(cast(List[List[float]], args.tolist()), actual):
+            expected = numpy.array(
+                vrm_types.normalize_weights_compatible_with_gl_float(arg),
+                dtype=numpy.float32,
+            ).tolist()
+            self.assertEqual(expected, actual_weights, f"Weights: {arg}")
+
     def test_nested_json_value_getter(self) -> None:
         self.assertEqual(
             123,
@@ -30,3 +77,37 @@ class TestVrmTypes(TestCase):
                 {"foo": [{"bar": 123}]}, ["foo", 0, "bar"]
             ),
         )
+
+    def test_nested_json_value_getter_does_not_consume_attrs(self) -> None:
+        attrs: List[Union[int, str]] = ["foo", 0, "bar"]
+        vrm_types.nested_json_value_getter({"foo": [{"bar": 123}]}, attrs)
+        self.assertEqual(["foo", 0, "bar"], attrs)
+        self.assertEqual(
+            "default",
+            vrm_types.nested_json_value_getter(
+                {"foo": [{"bar": 123}]}, ["foo", 1, "bar"], "default"
+            ),
+        )
+
+    def test_default_first_person_params_are_not_shared(self) -> None:
+        params = vrm_types.Vrm0.default_first_person_params()
+        params["lookAtHorizontalInner"]["yRange"] = 20
+        params["meshAnnotations"].append({"mesh": 0})
+        self.assertEqual(10, params["lookAtVerticalUp"]["yRange"])
+        self.assertEqual(
+            {"curve": [0, 0, 0, 1, 1, 1, 1, 0], "xRange": 90, "yRange": 10},
+            vrm_types.Vrm0.default_first_person_params()["lookAtHorizontalInner"],
+        )
+        self.assertEqual(
+            [], vrm_types.Vrm0.default_first_person_params()["meshAnnotations"]
+        )
+
+    def test_human_bones_traversal_order(self) -> None:
+        human_bones = vrm_types.HumanBones
+        order = human_bones.traversal_order
+        self.assertEqual("hips", order[0])
+        self.assertEqual(sorted([*human_bones.hierarchy, "hips"]), sorted(order))
+        self.assertEqual(tuple(reversed(order)), human_bones.reverse_order)
+        for child, parent in human_bones.hierarchy.items():
+            self.assertLess(order.index(parent), order.index(child))
+            self.assertEqual(human_bones.depth[parent] + 1, human_bones.depth[child])